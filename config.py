@@ -1,24 +1,73 @@
 """配置管理模块"""
 import json
 import os
-from typing import Any, Dict
+import types
+from typing import Any, Dict, Mapping
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 键不存在时的哨兵值
+_MISSING = object()
+
+
+def _resolve(config: Dict[str, Any], key: str) -> Any:
+    """按点号分隔的路径在嵌套配置中查找值
+    
+    Args:
+        config: 配置字典
+        key: 配置键（如 "font.size"）
+        
+    Returns:
+        对应的值；键不存在时返回 _MISSING
+    """
+    value = config
+    for part in key.split('.'):
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        else:
+            return _MISSING
+    return value
+
+
+def _to_dict(mapping: Mapping[str, Any]) -> Dict[str, Any]:
+    """将（可能只读的）嵌套映射递归复制为可修改的字典
+    
+    Args:
+        mapping: 源映射
+        
+    Returns:
+        新的嵌套字典
+    """
+    return {
+        key: _to_dict(value) if isinstance(value, Mapping) else value
+        for key, value in mapping.items()
+    }
 
 
 class ConfigManager:
-    """配置管理器类，负责读取和保存配置文件"""
+    """配置管理器类，负责读取和保存配置文件
+    
+    get() 会缓存已解析的键，修改配置应通过 save() 或整体替换 config 属性完成；
+    直接原地修改 config 字典后需调用 save(config)，否则 get() 可能返回旧值。
+    """
     
-    DEFAULT_CONFIG = {
+    # 只读的默认配置，使用时通过 _to_dict 复制为可修改的字典
+    DEFAULT_CONFIG = types.MappingProxyType({
         "hotkey": "ctrl+shift+t",
         "window_opacity": 0.9,
-        "default_position": {
+        "default_position": types.MappingProxyType({
             "x": 100,
             "y": 100
-        },
-        "font": {
+        }),
+        "font": types.MappingProxyType({
             "family": "Arial",
             "size": 12
-        }
-    }
+        })
+    })
     
     def __init__(self, config_path: str = "config.json"):
         """初始化配置管理器
@@ -27,24 +76,42 @@ class ConfigManager:
             config_path: 配置文件路径
         """
         self.config_path = config_path
+        # 磁盘上的文件是否与 self.config 一致，只有成功加载或保存后才为真
+        self._disk_in_sync = False
+        # 点号键到值的扁平表，按需填充：只有被访问过的键才会被解析
+        self._flat: Dict[str, Any] = {}
         self.config = self._load_or_create_config()
     
+    @property
+    def config(self) -> Dict[str, Any]:
+        """当前配置字典"""
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        """替换配置字典并清空 get() 的缓存"""
+        self._config = value
+        self._flat = {}
+    
     def _load_or_create_config(self) -> Dict[str, Any]:
         """加载配置文件，如果不存在则创建默认配置
         
         Returns:
             配置字典
         """
-        if os.path.exists(self.config_path):
-            try:
-                return self.load()
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"配置文件加载失败: {e}，使用默认配置")
-                return self.DEFAULT_CONFIG.copy()
-        else:
+        # 直接尝试打开文件，避免先检查是否存在带来的额外系统调用和竞态
+        try:
+            config = self.load()
+            self._disk_in_sync = True
+            return config
+        except FileNotFoundError:
             # 创建默认配置文件
-            self.save(self.DEFAULT_CONFIG)
-            return self.DEFAULT_CONFIG.copy()
+            config = _to_dict(self.DEFAULT_CONFIG)
+            self.save(config)
+            return config
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"配置文件加载失败: {e}，使用默认配置")
+            return _to_dict(self.DEFAULT_CONFIG)
     
     def load(self) -> Dict[str, Any]:
         """从文件加载配置
@@ -52,22 +119,44 @@ class ConfigManager:
         Returns:
             配置字典
         """
+        if orjson is not None:
+            with open(self.config_path, 'rb') as f:
+                return orjson.loads(f.read())
         with open(self.config_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     
     def save(self, config: Dict[str, Any]) -> None:
         """保存配置到文件
         
+        先写入临时文件再用 os.replace 替换，避免写入中途退出导致配置文件损坏。
+        
         Args:
             config: 要保存的配置字典
         """
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        # 内容与磁盘一致时跳过写入（同一对象可能已被原地修改，仍需写入；
+        # 加载失败时磁盘文件已损坏，必须重写）
+        current = getattr(self, 'config', None)
+        if self._disk_in_sync and config is not current and config == current:
+            return
+        
+        tmp_path = self.config_path + '.tmp'
+        if orjson is not None:
+            # orjson 直接输出 UTF-8 字节，无需 ensure_ascii
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.config_path)
+        self._disk_in_sync = True
         self.config = config
     
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置项
         
+        已解析的值会被缓存，直到 config 被替换或调用 save()。
+        
         Args:
             key: 配置键，支持点号分隔的嵌套键（如 "font.size"）
             default: 默认值
@@ -75,13 +164,11 @@ class ConfigManager:
         Returns:
             配置值
         """
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
+        value = self._flat.get(key, _MISSING)
+        if value is _MISSING:
+            value = _resolve(self.config, key)
+            if value is _MISSING:
+                # 不缓存缺失的键，不同调用可能传入不同的默认值
                 return default
-        
+            self._flat[key] = value
         return value
@@ -1,7 +1,110 @@
 """主应用程序入口"""
-import keyboard
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+import re
+import sys
 import threading
+import weakref
+
+
+# keyboard 库延迟导入，避免拖慢启动
+_keyboard = None
+
+
+def _get_keyboard():
+    """获取 keyboard 模块（首次调用时导入）"""
+    global _keyboard
+    if _keyboard is None:
+        import keyboard as _kb
+        _keyboard = _kb
+    return _keyboard
+
+
+# Win32 RegisterHotKey 相关常量
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+MOD_NOREPEAT = 0x4000
+WM_QUIT = 0x0012
+WM_USER = 0x0400
+WM_HOTKEY = 0x0312
+PM_NOREMOVE = 0x0000
+HOTKEY_ID = 1
+
+_WIN32_MODIFIERS = {
+    'ctrl': MOD_CONTROL,
+    'control': MOD_CONTROL,
+    'shift': MOD_SHIFT,
+    'alt': MOD_ALT,
+    'win': MOD_WIN,
+    'cmd': MOD_WIN,
+}
+
+_WIN32_NAMED_KEYS = {
+    'space': 0x20,
+    'enter': 0x0D,
+    'return': 0x0D,
+    'tab': 0x09,
+    'esc': 0x1B,
+    'escape': 0x1B,
+    'backspace': 0x08,
+    'insert': 0x2D,
+    'delete': 0x2E,
+    'home': 0x24,
+    'end': 0x23,
+    'page up': 0x21,
+    'page down': 0x22,
+    'left': 0x25,
+    'up': 0x26,
+    'right': 0x27,
+    'down': 0x28,
+}
+
+# keyboard 库额外支持的修饰键名称（Win32 无法映射时由 keyboard 库注册）
+_KEYBOARD_MODIFIERS = ('windows', 'command', 'option', 'alt gr')
+
+# 快捷键格式：任意个修饰键 + 一个按键
+# 按键名称按 keyboard 库的写法宽松匹配（如 "t"、"f4"、"del"、"page up"、"num 1"、","），
+# 能否映射为 Win32 虚拟键码由 _parse_win32_hotkey 判断，无法映射时回退到 keyboard 库
+_HOTKEY_RE = re.compile(
+    r'(?:(?:(?:left|right) )?(?:' + '|'.join(_KEYBOARD_MODIFIERS + tuple(_WIN32_MODIFIERS)) + r')\s*\+\s*)*'
+    r'(?:[a-z0-9]+(?: [a-z0-9]+)?|[`\-=\[\];\',./\\])',
+    re.IGNORECASE
+)
+
+
+def _parse_win32_hotkey(hotkey: str) -> Optional[Tuple[int, int]]:
+    """将快捷键字符串解析为 RegisterHotKey 所需的修饰键标志和虚拟键码
+    
+    Args:
+        hotkey: 快捷键字符串（如 "ctrl+shift+t"）
+        
+    Returns:
+        (modifiers, vk) 元组；无法解析时返回 None
+    """
+    modifiers = 0
+    vk = None
+    
+    for part in hotkey.lower().split('+'):
+        part = part.strip()
+        if part in _WIN32_MODIFIERS:
+            modifiers |= _WIN32_MODIFIERS[part]
+        elif vk is not None:
+            # 只支持一个非修饰键
+            return None
+        elif len(part) == 1 and part.isascii() and part.isalnum():
+            vk = ord(part.upper())
+        elif part[:1] == 'f' and part[1:].isdigit() and 1 <= int(part[1:]) <= 24:
+            vk = 0x70 + int(part[1:]) - 1
+        elif part in _WIN32_NAMED_KEYS:
+            vk = _WIN32_NAMED_KEYS[part]
+        else:
+            return None
+    
+    if vk is None:
+        return None
+    return modifiers, vk
 
 
 class HotkeyListener:
@@ -18,41 +121,53 @@ class HotkeyListener:
         self.callback = callback
         self._is_running = False
         self._listener_thread = None
+        self._listener_thread_id = None
+        self._register_error = None
+        # 有界回调线程池，复用线程并避免连续按键时创建过多线程
+        self._pool = None
     
-    def start(self) -> None:
+    def start(self, log: Callable[[str], None] = print) -> None:
         """启动快捷键监听
         
+        Args:
+            log: 输出状态信息的函数（默认直接打印，启动时可传入缓冲函数以保持输出顺序）
+            
         Raises:
             Exception: 当快捷键注册失败时抛出异常
         """
         if self._is_running:
-            print(f"快捷键监听器已在运行: {self.hotkey}")
+            log(f"快捷键监听器已在运行: {self.hotkey}")
             return
         
+        # 启动回调线程池（默认快捷键回退时同样需要）
+        self._start_pool()
+        
         try:
             # 验证快捷键格式
             if not self._validate_hotkey(self.hotkey):
                 raise ValueError(f"无效的快捷键格式: {self.hotkey}")
             
             # 注册全局快捷键
-            keyboard.add_hotkey(self.hotkey, self._on_hotkey_pressed)
+            self._register_hotkey()
             self._is_running = True
-            print(f"快捷键监听器已启动: {self.hotkey}")
+            log(f"快捷键监听器已启动: {self.hotkey}")
             
         except Exception as e:
             error_msg = f"快捷键注册失败: {e}"
-            print(error_msg)
+            log(error_msg)
             # 尝试使用默认快捷键
             if self.hotkey != "ctrl+shift+t":
-                print("尝试使用默认快捷键: ctrl+shift+t")
+                log("尝试使用默认快捷键: ctrl+shift+t")
                 self.hotkey = "ctrl+shift+t"
                 try:
-                    keyboard.add_hotkey(self.hotkey, self._on_hotkey_pressed)
+                    self._register_hotkey()
                     self._is_running = True
-                    print(f"使用默认快捷键成功: {self.hotkey}")
+                    log(f"使用默认快捷键成功: {self.hotkey}")
                 except Exception as fallback_error:
+                    self._stop_pool()
                     raise Exception(f"快捷键注册失败，包括默认快捷键: {fallback_error}")
             else:
+                self._stop_pool()
                 raise Exception(error_msg)
     
     def stop(self) -> None:
@@ -61,12 +176,110 @@ class HotkeyListener:
             return
         
         try:
-            keyboard.remove_hotkey(self.hotkey)
+            self._unregister_hotkey()
+            self._stop_pool()
             self._is_running = False
             print(f"快捷键监听器已停止: {self.hotkey}")
         except Exception as e:
             print(f"停止快捷键监听时出错: {e}")
     
+    def _start_pool(self) -> None:
+        """创建回调线程池（如果尚未创建）"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='hotkey-cb')
+    
+    def _stop_pool(self) -> None:
+        """关闭回调线程池，不等待正在执行的回调"""
+        if self._pool is None:
+            return
+        if sys.version_info >= (3, 9):
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._pool.shutdown(wait=False)
+        self._pool = None
+    
+    def _run_callback(self) -> None:
+        """在线程池中执行回调并输出异常"""
+        try:
+            self.callback()
+        except Exception as e:
+            print(f"快捷键回调执行失败: {e}")
+    
+    def _register_hotkey(self) -> None:
+        """注册当前快捷键
+        
+        Windows 上使用 RegisterHotKey，仅在组合键触发时收到 WM_HOTKEY 消息；
+        其它平台或无法解析的快捷键回退到 keyboard 库。
+        
+        Raises:
+            OSError: 当 RegisterHotKey 调用失败时抛出异常
+        """
+        parsed = _parse_win32_hotkey(self.hotkey) if sys.platform == 'win32' else None
+        if parsed is None:
+            _get_keyboard().add_hotkey(self.hotkey, self._on_hotkey_pressed)
+            return
+        
+        registered = threading.Event()
+        self._register_error = None
+        self._listener_thread = threading.Thread(
+            target=self._run_message_loop,
+            args=(parsed[0], parsed[1], registered),
+            daemon=True
+        )
+        self._listener_thread.start()
+        registered.wait()
+        
+        if self._register_error is not None:
+            self._listener_thread.join()
+            self._listener_thread = None
+            raise self._register_error
+    
+    def _unregister_hotkey(self) -> None:
+        """注销当前快捷键"""
+        if self._listener_thread is None:
+            _get_keyboard().remove_hotkey(self.hotkey)
+            return
+        
+        import ctypes
+        # 让消息循环线程退出，快捷键在该线程中注销
+        ctypes.windll.user32.PostThreadMessageW(self._listener_thread_id, WM_QUIT, 0, 0)
+        self._listener_thread.join(timeout=1.0)
+        self._listener_thread = None
+        self._listener_thread_id = None
+    
+    def _run_message_loop(self, modifiers: int, vk: int, registered: threading.Event) -> None:
+        """在后台线程中注册快捷键并运行 Win32 消息循环
+        
+        Args:
+            modifiers: 修饰键标志
+            vk: 虚拟键码
+            registered: 注册完成（无论成功与否）时设置的事件
+        """
+        import ctypes
+        from ctypes import wintypes
+        
+        user32 = ctypes.WinDLL('user32', use_last_error=True)
+        kernel32 = ctypes.WinDLL('kernel32')
+        msg = wintypes.MSG()
+        
+        # 确保线程消息队列已创建，PostThreadMessageW 才能投递 WM_QUIT
+        user32.PeekMessageW(ctypes.byref(msg), None, WM_USER, WM_USER, PM_NOREMOVE)
+        self._listener_thread_id = kernel32.GetCurrentThreadId()
+        
+        if not user32.RegisterHotKey(None, HOTKEY_ID, modifiers | MOD_NOREPEAT, vk):
+            self._register_error = ctypes.WinError(ctypes.get_last_error())
+            registered.set()
+            return
+        registered.set()
+        
+        try:
+            # GetMessageW 收到 WM_QUIT 时返回 0，出错时返回 -1
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == WM_HOTKEY:
+                    self._on_hotkey_pressed()
+        finally:
+            user32.UnregisterHotKey(None, HOTKEY_ID)
+    
     def _validate_hotkey(self, hotkey: str) -> bool:
         """验证快捷键格式是否有效
         
@@ -79,30 +292,19 @@ class HotkeyListener:
         if not hotkey or not isinstance(hotkey, str):
             return False
         
-        # 基本格式检查：至少包含一个字符
-        if len(hotkey.strip()) == 0:
-            return False
-        
-        # 检查是否包含有效的按键组合
-        # keyboard库支持的格式如: "ctrl+shift+t", "alt+f4" 等
-        parts = hotkey.lower().split('+')
-        if len(parts) == 0:
-            return False
-        
-        # 常见的修饰键
-        valid_modifiers = {'ctrl', 'shift', 'alt', 'win', 'cmd', 'control'}
-        
-        # 至少应该有一个按键
-        return True
+        # 检查是否为有效的按键组合，如 "ctrl+shift+t", "alt+f4" 等
+        return _HOTKEY_RE.fullmatch(hotkey.strip()) is not None
     
     def _on_hotkey_pressed(self) -> None:
         """快捷键按下时的内部处理函数"""
         try:
-            # 在新线程中执行回调，避免阻塞快捷键监听
-            if self.callback:
-                # 使用线程执行回调，确保不阻塞keyboard库的事件循环
-                callback_thread = threading.Thread(target=self.callback, daemon=True)
-                callback_thread.start()
+            # 交给回调线程池执行，避免阻塞快捷键监听的事件循环
+            if not self.callback:
+                return
+            if self._pool is None:
+                print("快捷键回调线程池未启动，忽略本次按键")
+                return
+            self._pool.submit(self._run_callback)
         except Exception as e:
             print(f"快捷键回调执行失败: {e}")
 
@@ -118,7 +320,16 @@ class Application:
         self.hotkey_listener = None
         self.system_tray = None
         self.input_window = None
-        self.floating_windows = []  # 悬浮窗口列表
+        # 悬浮窗口集合（弱引用，窗口由 Tk 事件绑定保持存活，销毁后自动移除）
+        self.floating_windows = weakref.WeakSet()
+        
+        # 启动时缓存的屏幕尺寸和窗口透明度，避免每次创建窗口都重新查询
+        self.screen_width = 0
+        self.screen_height = 0
+        self.window_opacity = 0.9
+        
+        # 启动阶段的提示信息，缓冲后一次性输出
+        self._startup_log = []
         
         # 窗口位置偏移量（用于多窗口布局）
         self.window_offset = 0
@@ -131,45 +342,61 @@ class Application:
             import tkinter as tk
             self.root = tk.Tk()
             self.root.withdraw()  # 隐藏主窗口
-            print("✓ Tkinter主窗口已创建")
+            self.screen_width = self.root.winfo_screenwidth()
+            self.screen_height = self.root.winfo_screenheight()
+            self._startup_log.append("✓ Tkinter主窗口已创建")
             
             # 初始化配置管理器并加载配置
             from config import ConfigManager
             self.config_manager = ConfigManager()
-            print("✓ 配置已加载")
+            self._startup_log.append("✓ 配置已加载")
+            
+            # 获取窗口透明度配置
+            self.window_opacity = self.config_manager.get('window_opacity', 0.9)
             
             # 获取快捷键配置
             hotkey = self.config_manager.get('hotkey', 'ctrl+shift+t')
             
             # 初始化快捷键监听器
             self.hotkey_listener = HotkeyListener(hotkey, self.show_input_window)
-            self.hotkey_listener.start()
-            print("✓ 快捷键监听器已启动")
+            self.hotkey_listener.start(log=self._startup_log.append)
+            self._startup_log.append("✓ 快捷键监听器已启动")
             
             # 初始化系统托盘
             from tray import SystemTray
             self.system_tray = SystemTray(self.quit)
             self.system_tray.start()
-            print("✓ 系统托盘已启动")
+            self._startup_log.append("✓ 系统托盘已启动")
             
-            print("\n" + "=" * 50)
-            print(f"应用程序已就绪！")
-            print(f"快捷键: {hotkey}")
-            print("使用说明:")
-            print(f"  - 按 {hotkey} 打开输入窗口")
-            print("  - 右键点击托盘图标退出应用")
-            print("=" * 50 + "\n")
+            self._startup_log.extend([
+                "\n" + "=" * 50,
+                "应用程序已就绪！",
+                f"快捷键: {hotkey}",
+                "使用说明:",
+                f"  - 按 {hotkey} 打开输入窗口",
+                "  - 右键点击托盘图标退出应用",
+                "=" * 50 + "\n",
+            ])
+            self._flush_startup_log()
             
             # 启动Tkinter主循环
             self.root.mainloop()
             
         except Exception as e:
+            self._flush_startup_log()
             print(f"应用程序启动失败: {e}")
             import traceback
             traceback.print_exc()
             self.quit()
             raise
     
+    def _flush_startup_log(self) -> None:
+        """将缓冲的启动信息一次性写入标准输出"""
+        if self._startup_log:
+            sys.stdout.write("\n".join(self._startup_log) + "\n")
+            sys.stdout.flush()
+            self._startup_log.clear()
+    
     def show_input_window(self) -> None:
         """显示输入窗口"""
         try:
@@ -184,7 +411,11 @@ class Application:
         try:
             from windows import InputWindow
             if self.input_window is None:
-                self.input_window = InputWindow(self.root, self.create_floating_window)
+                self.input_window = InputWindow(
+                    self.root,
+                    self.create_floating_window,
+                    (self.screen_width, self.screen_height)
+                )
             self.input_window.show()
         except Exception as e:
             print(f"创建输入窗口失败: {e}")
@@ -198,15 +429,12 @@ class Application:
         try:
             from windows import FloatingWindow
             
-            # 获取窗口透明度配置
-            opacity = self.config_manager.get('window_opacity', 0.9)
-            
             # 创建悬浮窗口
             floating_window = FloatingWindow(
                 self.root,
                 text,
                 self.remove_floating_window,
-                opacity
+                self.window_opacity
             )
             
             # 计算窗口位置
@@ -216,7 +444,7 @@ class Application:
             floating_window.show(x, y)
             
             # 添加到窗口列表
-            self.floating_windows.append(floating_window)
+            self.floating_windows.add(floating_window)
             
             print(f"创建悬浮窗口: {text[:20]}...")
             
@@ -229,9 +457,9 @@ class Application:
         Returns:
             (x, y) 坐标元组
         """
-        # 获取屏幕尺寸
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
+        # 使用启动时缓存的屏幕尺寸
+        screen_width = self.screen_width
+        screen_height = self.screen_height
         
         # 默认窗口尺寸估算
         window_width = 250
@@ -253,15 +481,14 @@ class Application:
         return (x, y)
     
     def remove_floating_window(self, window) -> None:
-        """从列表中移除悬浮窗口
+        """从集合中移除悬浮窗口
         
         Args:
             window: 要移除的FloatingWindow对象
         """
         try:
-            if window in self.floating_windows:
-                self.floating_windows.remove(window)
-                print(f"移除悬浮窗口，剩余窗口数: {len(self.floating_windows)}")
+            self.floating_windows.discard(window)
+            print(f"移除悬浮窗口，剩余窗口数: {len(self.floating_windows)}")
         except Exception as e:
             print(f"移除悬浮窗口失败: {e}")
     
@@ -279,7 +506,7 @@ class Application:
                 self.system_tray.stop()
             
             # 关闭所有悬浮窗口
-            for window in self.floating_windows[:]:  # 使用副本避免迭代时修改列表
+            for window in list(self.floating_windows):  # 使用副本避免迭代时修改集合
                 try:
                     window.close()
                 except:
@@ -288,7 +515,7 @@ class Application:
             # 关闭输入窗口
             if self.input_window:
                 try:
-                    self.input_window.hide()
+                    self.input_window.destroy()
                 except:
                     pass
             
@@ -304,27 +531,28 @@ class Application:
 
 
 if __name__ == "__main__":
-    import time
-    import sys
-    
     print("=" * 50)
     print("悬浮文本显示应用程序")
     print("=" * 50)
     print("正在启动...")
     
-    start_time = time.time()
+    # 启动耗时统计仅在调试模式下启用，python -O 运行时会被整体移除
+    if __debug__:
+        import time
+        start_time = time.time()
     
     try:
         # 创建并运行应用程序
         app = Application()
         
-        # 计算初始化时间
-        init_time = time.time() - start_time
-        print(f"初始化完成，耗时: {init_time:.2f} 秒")
-        
-        # 检查是否在3秒内完成初始化（需求5.5）
-        if init_time > 3.0:
-            print(f"警告: 初始化时间超过3秒 ({init_time:.2f}秒)")
+        if __debug__:
+            # 计算初始化时间
+            init_time = time.time() - start_time
+            print(f"初始化完成，耗时: {init_time:.2f} 秒")
+            
+            # 检查是否在3秒内完成初始化（需求5.5）
+            if init_time > 3.0:
+                print(f"警告: 初始化时间超过3秒 ({init_time:.2f}秒)")
         
         # 运行应用程序
         app.run()
@@ -1,9 +1,41 @@
 """系统托盘模块"""
-import pystray
-from PIL import Image, ImageDraw, ImageFont
-from typing import Callable
+from __future__ import annotations
+
+from typing import Callable, TYPE_CHECKING
 import threading
 
+# pystray 和 PIL 在首次使用时才导入，避免拖慢启动
+if TYPE_CHECKING:
+    import pystray
+    from PIL import Image
+
+
+# 默认托盘图标的磁盘缓存路径
+DEFAULT_ICON_CACHE_PATH = ".tray_icon_cache.png"
+
+# 绘制默认图标所用的字体，首次使用时加载并在所有实例间共享
+_DEFAULT_FONT = None
+
+
+def _get_default_font():
+    """
+    获取绘制默认图标的字体（只加载一次）
+    
+    Returns:
+        PIL 字体对象
+    """
+    global _DEFAULT_FONT
+    if _DEFAULT_FONT is None:
+        from PIL import ImageFont
+        
+        try:
+            # 尝试使用系统字体
+            _DEFAULT_FONT = ImageFont.truetype("arial.ttf", 40)
+        except:
+            # 如果失败，使用默认字体
+            _DEFAULT_FONT = ImageFont.load_default()
+    return _DEFAULT_FONT
+
 
 class SystemTray:
     """系统托盘类，提供托盘图标和菜单功能"""
@@ -26,13 +58,28 @@ class SystemTray:
         Returns:
             PIL Image 对象
         """
+        from PIL import Image
+        
         try:
             # 尝试加载指定的图标文件
             icon_path = "20251122004844.ico"
             return Image.open(icon_path)
-        except FileNotFoundError:
-            # 如果图标文件不存在，使用原来的生成方式
-            return self._create_default_icon_image()
+        except FileNotFoundError:
+            pass
+        
+        try:
+            # 优先使用上次生成并缓存的默认图标，避免重复加载字体和绘制
+            return Image.open(DEFAULT_ICON_CACHE_PATH)
+        except OSError:
+            pass
+        
+        # 如果图标文件不存在，使用原来的生成方式并缓存结果
+        image = self._create_default_icon_image()
+        try:
+            image.save(DEFAULT_ICON_CACHE_PATH, "PNG", optimize=True)
+        except OSError as e:
+            print(f"缓存托盘图标失败: {e}")
+        return image
     
     def _create_default_icon_image(self) -> Image.Image:
         """
@@ -41,22 +88,17 @@ class SystemTray:
         Returns:
             PIL Image 对象
         """
+        from PIL import Image, ImageDraw
+        
         # 创建 64x64 的图标
         width = 64
         height = 64
-        image = Image.new('RGB', (width, height), color='white')
+        # 直接以蓝色背景创建图像，无需再绘制整幅矩形
+        image = Image.new('RGB', (width, height), color='#4A90E2')
         draw = ImageDraw.Draw(image)
         
-        # 绘制蓝色背景
-        draw.rectangle([0, 0, width, height], fill='#4A90E2')
-        
         # 绘制白色文字 'T'
-        try:
-            # 尝试使用系统字体
-            font = ImageFont.truetype("arial.ttf", 40)
-        except:
-            # 如果失败，使用默认字体
-            font = ImageFont.load_default()
+        font = _get_default_font()
         
         # 计算文字位置使其居中
         text = "T"
@@ -76,6 +118,8 @@ class SystemTray:
         Returns:
             pystray.Menu 对象
         """
+        import pystray
+        
         return pystray.Menu(
             pystray.MenuItem('退出', self._on_quit_clicked)
         )
@@ -96,6 +140,8 @@ class SystemTray:
     
     def start(self) -> None:
         """启动系统托盘（在新线程中运行）"""
+        import pystray
+        
         # 创建图标
         icon_image = self._create_icon_image()
         menu = self._create_menu()
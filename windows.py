@@ -1,31 +1,226 @@
 """窗口组件模块"""
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable
+from tkinter import font as tkfont
+from bisect import bisect_right
+from time import monotonic
+from typing import Callable, Tuple
+
+
+# 界面配色
+COLOR_BG = '#2c3e50'  # 深色背景
+COLOR_PANEL = '#34495e'  # 标题栏和输入框背景
+COLOR_TEXT = '#ecf0f1'  # 主要文字
+COLOR_SUBTEXT = '#bdc3c7'  # 说明文字
+COLOR_GRAY = '#95a5a6'
+COLOR_GRAY_DARK = '#7f8c8d'
+COLOR_RED = '#e74c3c'
+COLOR_RED_DARK = '#c0392b'
+COLOR_ACCENT = '#3498db'  # 光标和焦点颜色
+COLOR_WHITE = '#ffffff'
+COLOR_TRANSPARENT = '#000001'  # 悬浮窗口的透明色键
+
+# 界面字体
+FONT_FAMILY = "Microsoft YaHei UI"
+FONT_TITLE = (FONT_FAMILY, 11, "bold")
+FONT_DIALOG = (FONT_FAMILY, 11)
+FONT_BUTTON = (FONT_FAMILY, 10, "bold")
+FONT_LABEL = (FONT_FAMILY, 10)
+FONT_INPUT = (FONT_FAMILY, 12)
+FONT_HINT = (FONT_FAMILY, 9)
+FONT_CLOSE = ("Arial", 12, "bold")
+
+# 拖动/缩放判定阈值（像素距离的平方），小于该值视为单击
+DRAG_THRESHOLD_SQ = 5 * 5
+
+# 输入窗口的固定尺寸
+INPUT_WINDOW_WIDTH = 450
+INPUT_WINDOW_HEIGHT = 180
+
+# 悬浮窗口字体大小随面积变化：size = int(16 * (area / (500 * 200)) ** 0.3)，限制在10-32之间
+# 预先计算字体大小达到 11..32 所需的最小面积，运行时只需二分查找
+FONT_BASE_SIZE = 16
+FONT_BASE_AREA = 500 * 200  # 初始窗口面积
+FONT_MIN_SIZE = 10
+FONT_MAX_SIZE = 32
+_FONT_AREA_THRESHOLDS = [
+    FONT_BASE_AREA * (size / FONT_BASE_SIZE) ** (1 / 0.3)
+    for size in range(FONT_MIN_SIZE + 1, FONT_MAX_SIZE + 1)
+]
+
+
+def _ensure_styles(parent: tk.Misc) -> None:
+    """注册界面使用的 ttk 样式（每个父窗口只注册一次，所有窗口共享）
+    
+    Args:
+        parent: 父窗口（Tkinter主窗口）
+    """
+    # 注册标记保存在父窗口对象上（所有 Tk 根窗口的路径名都是 "."，不能用作键）
+    if getattr(parent, '_moon_styles', False):
+        return
+    
+    style = ttk.Style(parent)
+    style.configure("Moon.TFrame", background=COLOR_BG)
+    style.configure("Moon.Panel.TFrame", background=COLOR_PANEL)
+    style.configure("Moon.Floating.TFrame", background=COLOR_TRANSPARENT)
+    style.configure("Moon.Title.TLabel", font=FONT_TITLE, background=COLOR_PANEL, foreground=COLOR_TEXT)
+    style.configure("Moon.Dialog.TLabel", font=FONT_DIALOG, background=COLOR_BG, foreground=COLOR_TEXT)
+    style.configure("Moon.TLabel", font=FONT_LABEL, background=COLOR_BG, foreground=COLOR_SUBTEXT)
+    style.configure("Moon.Hint.TLabel", font=FONT_HINT, background=COLOR_BG, foreground=COLOR_GRAY_DARK)
+    parent._moon_styles = True
+
+
+def _on_hover_enter(event) -> None:
+    """鼠标进入按钮时应用悬停配色"""
+    event.widget.config(**event.widget.hover_style)
+
+
+def _on_hover_leave(event) -> None:
+    """鼠标离开按钮时恢复默认配色"""
+    event.widget.config(**event.widget.base_style)
+
+
+def _bind_hover(widget: tk.Widget, base_style: dict, hover_style: dict) -> None:
+    """为按钮绑定悬停配色切换（所有按钮共享同一对回调）
+    
+    Args:
+        widget: 按钮控件
+        base_style: 默认配色（如 {"bg": "#95a5a6"}）
+        hover_style: 悬停配色
+    """
+    widget.base_style = base_style
+    widget.hover_style = hover_style
+    widget.bind('<Enter>', _on_hover_enter)
+    widget.bind('<Leave>', _on_hover_leave)
+
+
+def _on_confirm_yes(event) -> None:
+    """确认删除：隐藏对话框并关闭目标悬浮窗口"""
+    dialog = event.widget.winfo_toplevel()
+    dialog.withdraw()
+    target, dialog.target = dialog.target, None
+    if target is not None:
+        target.close()
+
+
+def _on_confirm_no(event) -> None:
+    """取消删除：隐藏对话框"""
+    dialog = event.widget.winfo_toplevel()
+    dialog.withdraw()
+    dialog.target = None
+
+
+def _get_confirm_dialog(parent: tk.Tk) -> tk.Toplevel:
+    """获取删除确认对话框（每个父窗口只创建一次，之后隐藏复用）
+    
+    Args:
+        parent: 父窗口（Tkinter主窗口）
+        
+    Returns:
+        隐藏状态的对话框，target 属性为待删除的悬浮窗口
+    """
+    # 对话框保存在父窗口对象上（所有 Tk 根窗口的路径名都是 "."，不能用作键）
+    dialog = getattr(parent, '_confirm_dialog', None)
+    if dialog is not None and dialog.winfo_exists():
+        return dialog
+    
+    _ensure_styles(parent)
+    
+    # 创建确认对话框
+    dialog = tk.Toplevel(parent)
+    dialog.withdraw()
+    dialog.title("确认删除")
+    dialog.geometry("250x100")
+    dialog.attributes('-topmost', True)
+    dialog.overrideredirect(True)
+    dialog.target = None
+    
+    # 设置背景
+    dialog.configure(bg=COLOR_BG)
+    
+    # 提示文字
+    label = ttk.Label(
+        dialog,
+        text="确定要删除这个窗口吗？",
+        style="Moon.Dialog.TLabel"
+    )
+    label.pack(pady=15)
+    
+    # 按钮容器
+    button_frame = ttk.Frame(dialog, style="Moon.TFrame")
+    button_frame.pack(pady=10)
+    
+    # 确认按钮
+    yes_btn = tk.Label(
+        button_frame,
+        text="确定",
+        font=FONT_BUTTON,
+        bg=COLOR_RED,
+        fg=COLOR_WHITE,
+        padx=20,
+        pady=5,
+        cursor='hand2'
+    )
+    yes_btn.pack(side=tk.LEFT, padx=10)
+    yes_btn.bind('<Button-1>', _on_confirm_yes)
+    _bind_hover(yes_btn, {'bg': COLOR_RED}, {'bg': COLOR_RED_DARK})
+    
+    # 取消按钮
+    no_btn = tk.Label(
+        button_frame,
+        text="取消",
+        font=FONT_BUTTON,
+        bg=COLOR_GRAY,
+        fg=COLOR_WHITE,
+        padx=20,
+        pady=5,
+        cursor='hand2'
+    )
+    no_btn.pack(side=tk.LEFT, padx=10)
+    no_btn.bind('<Button-1>', _on_confirm_no)
+    _bind_hover(no_btn, {'bg': COLOR_GRAY}, {'bg': COLOR_GRAY_DARK})
+    
+    dialog.yes_btn = yes_btn
+    dialog.no_btn = no_btn
+    parent._confirm_dialog = dialog
+    return dialog
 
 
 class InputWindow:
     """输入窗口类，用于接收用户文本输入"""
     
-    def __init__(self, parent: tk.Tk, on_submit: Callable[[str], None]):
+    def __init__(self, parent: tk.Tk, on_submit: Callable[[str], None],
+                 screen_size: Tuple[int, int] = None):
         """初始化输入窗口
         
         Args:
             parent: 父窗口（Tkinter主窗口）
             on_submit: 提交回调函数，接收输入的文本
+            screen_size: 屏幕尺寸 (宽, 高)（可选，未提供时首次居中时查询一次）
         """
         self.parent = parent
         self.on_submit = on_submit
+        self.screen_size = screen_size
         self.window = None
         self.entry = None
+        self._visible = False
     
     def show(self) -> None:
-        """显示输入窗口"""
-        if self.window is not None:
-            self.window.lift()
-            self.entry.focus_set()
-            return
-        
+        """显示输入窗口（首次调用时创建，之后复用已创建的窗口）"""
+        if self.window is None:
+            self._build()
+        elif not self._visible:
+            # 复用已隐藏的窗口：清空输入并重新显示
+            self.entry.delete(0, tk.END)
+            self.window.deiconify()
+            self._center_window()
+        
+        self._visible = True
+        self.window.lift()
+        self.entry.focus_set()
+    
+    def _build(self) -> None:
+        """创建输入窗口及其所有控件"""
         # 创建Toplevel窗口
         self.window = tk.Toplevel(self.parent)
         self.window.title("")
@@ -37,30 +232,24 @@ class InputWindow:
         self.window.attributes('-topmost', True)
         
         # 设置窗口背景色（深色主题）
-        bg_color = '#2c3e50'
+        bg_color = COLOR_BG
         self.window.configure(bg=bg_color)
         
         # 创建主容器框架（带圆角效果的视觉）
-        main_frame = tk.Frame(
-            self.window,
-            bg=bg_color,
-            relief=tk.FLAT,
-            borderwidth=0
-        )
+        _ensure_styles(self.parent)
+        main_frame = ttk.Frame(self.window, style="Moon.TFrame")
         main_frame.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
         
         # 创建标题栏
-        title_bar = tk.Frame(main_frame, bg='#34495e', height=35)
+        title_bar = ttk.Frame(main_frame, style="Moon.Panel.TFrame", height=35)
         title_bar.pack(fill=tk.X)
         title_bar.pack_propagate(False)
         
         # 标题文字
-        title_label = tk.Label(
+        title_label = ttk.Label(
             title_bar,
             text="✨ 输入文本",
-            font=("Microsoft YaHei UI", 11, "bold"),
-            bg='#34495e',
-            fg='#ecf0f1'
+            style="Moon.Title.TLabel"
         )
         title_label.pack(side=tk.LEFT, padx=15, pady=8)
         
@@ -68,59 +257,52 @@ class InputWindow:
         close_btn = tk.Label(
             title_bar,
             text="✕",
-            font=("Arial", 12, "bold"),
-            bg='#34495e',
-            fg='#95a5a6',
+            font=FONT_CLOSE,
+            bg=COLOR_PANEL,
+            fg=COLOR_GRAY,
             cursor='hand2',
             padx=10
         )
         close_btn.pack(side=tk.RIGHT, padx=5)
         close_btn.bind('<Button-1>', self._on_cancel)
-        close_btn.bind('<Enter>', lambda e: close_btn.config(fg='#e74c3c', bg='#2c3e50'))
-        close_btn.bind('<Leave>', lambda e: close_btn.config(fg='#95a5a6', bg='#34495e'))
+        _bind_hover(
+            close_btn,
+            {'fg': COLOR_GRAY, 'bg': COLOR_PANEL},
+            {'fg': COLOR_RED, 'bg': COLOR_BG}
+        )
         
         # 内容区域
-        content_frame = tk.Frame(main_frame, bg=bg_color)
+        content_frame = ttk.Frame(main_frame, style="Moon.TFrame")
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # 创建提示标签（现代化设计）
-        label = tk.Label(
+        label = ttk.Label(
             content_frame,
             text="请输入要显示的文本内容",
-            font=("Microsoft YaHei UI", 10),
-            bg=bg_color,
-            fg='#bdc3c7'
+            style="Moon.TLabel"
         )
         label.pack(anchor=tk.W, pady=(0, 10))
         
-        # 创建输入框容器（带边框效果）
-        entry_frame = tk.Frame(
-            content_frame,
-            bg='#34495e',
-            relief=tk.FLAT,
-            borderwidth=1
-        )
-        entry_frame.pack(fill=tk.X, pady=(0, 15))
-        
-        # 创建文本输入框（现代化样式）
+        # 创建文本输入框（现代化样式，边框效果由高亮边框实现）
         self.entry = tk.Entry(
-            entry_frame,
-            font=("Microsoft YaHei UI", 12),
-            bg='#34495e',
-            fg='#ecf0f1',
-            insertbackground='#3498db',  # 光标颜色
+            content_frame,
+            font=FONT_INPUT,
+            bg=COLOR_PANEL,
+            fg=COLOR_TEXT,
+            insertbackground=COLOR_ACCENT,  # 光标颜色
             relief=tk.FLAT,
-            borderwidth=0
+            borderwidth=0,
+            highlightthickness=3,
+            highlightbackground=COLOR_PANEL,
+            highlightcolor=COLOR_ACCENT  # 获得焦点时的边框颜色
         )
-        self.entry.pack(fill=tk.X, padx=2, pady=2, ipady=8)
+        self.entry.pack(fill=tk.X, pady=(0, 15), ipady=8)
         
         # 提示信息
-        hint_label = tk.Label(
+        hint_label = ttk.Label(
             content_frame,
             text="按 Enter 确认 | 按 Esc 取消",
-            font=("Microsoft YaHei UI", 9),
-            bg=bg_color,
-            fg='#7f8c8d'
+            style="Moon.Hint.TLabel"
         )
         hint_label.pack(anchor=tk.W)
         
@@ -134,32 +316,35 @@ class InputWindow:
         self.window.protocol("WM_DELETE_WINDOW", self._on_cancel)
         
         # 设置窗口大小
-        self.window.geometry("450x180")
+        self.window.geometry(f"{INPUT_WINDOW_WIDTH}x{INPUT_WINDOW_HEIGHT}")
         
         # 居中显示窗口
         self._center_window()
-        
-        # 自动获取焦点
-        self.entry.focus_set()
     
     def hide(self) -> None:
-        """隐藏并销毁输入窗口"""
+        """隐藏输入窗口（保留控件以便下次复用）"""
+        if self.window is not None:
+            self.window.withdraw()
+            self._visible = False
+    
+    def destroy(self) -> None:
+        """销毁输入窗口"""
         if self.window is not None:
             self.window.destroy()
             self.window = None
             self.entry = None
+            self._visible = False
     
     def _center_window(self) -> None:
         """将窗口居中显示在屏幕上"""
-        self.window.update_idletasks()
-        
-        # 获取窗口尺寸
-        window_width = self.window.winfo_width()
-        window_height = self.window.winfo_height()
+        # 窗口尺寸是固定的，无需等待布局后再向 Tk 查询
+        window_width = INPUT_WINDOW_WIDTH
+        window_height = INPUT_WINDOW_HEIGHT
         
-        # 获取屏幕尺寸
-        screen_width = self.window.winfo_screenwidth()
-        screen_height = self.window.winfo_screenheight()
+        # 获取屏幕尺寸（优先使用调用方缓存的值，否则只查询一次）
+        if self.screen_size is None:
+            self.screen_size = (self.window.winfo_screenwidth(), self.window.winfo_screenheight())
+        screen_width, screen_height = self.screen_size
         
         # 计算居中位置
         x = (screen_width - window_width) // 2
@@ -174,7 +359,11 @@ class InputWindow:
         Args:
             event: 事件对象
         """
-        text = self.entry.get().strip()
+        raw = self.entry.get()
+        if not raw:  # 输入为空时无需再去除空白
+            return
+        
+        text = raw.strip()
         if text:  # 只有在有文本时才提交
             self.on_submit(text)
             self.hide()
@@ -188,6 +377,33 @@ class InputWindow:
         self.hide()
 
 
+class _WinfoCache:
+    """缓存悬浮窗口的几何信息，避免在事件处理中反复调用 winfo_*
+    
+    每个拖动/缩放手势开始时从窗口刷新一次（系统可能因显示器或 DPI 变化移动窗口），
+    手势过程中由设置几何的代码同步更新，运动事件中无需再查询窗口。
+    """
+    
+    __slots__ = ('w', 'h', 'x', 'y')
+    
+    def __init__(self):
+        self.w = None
+        self.h = None
+        self.x = None
+        self.y = None
+    
+    def refresh(self, window: tk.Toplevel) -> None:
+        """从窗口重新读取实际几何
+        
+        Args:
+            window: 要读取的窗口
+        """
+        self.w = window.winfo_width()
+        self.h = window.winfo_height()
+        self.x = window.winfo_x()
+        self.y = window.winfo_y()
+
+
 class FloatingWindow:
     """悬浮窗口类，用于显示置顶文本"""
     
@@ -205,7 +421,10 @@ class FloatingWindow:
         self.on_close = on_close
         self.opacity = opacity
         self.window = None
-        self.text_widget = None
+        self.main_frame = None
+        self.label_widget = None  # 显示文本用的标签
+        self.text_widget = None  # 编辑用的文本框，首次进入编辑模式时创建
+        self._font = None  # 显示和编辑共用的字体对象，缩放时只修改字号
         self._drag_start_x = 0
         self._drag_start_y = 0
         self._resize_start_x = 0
@@ -213,9 +432,20 @@ class FloatingWindow:
         self._resize_start_width = 0
         self._resize_start_height = 0
         self._is_editing = False
-        self._base_font_size = 16
+        self._base_font_size = FONT_BASE_SIZE
+        self._last_font_size = self._base_font_size  # 最近一次应用的字体大小
         self._click_count = 0
         self._last_click_time = 0
+        # 拖动/缩放时待应用的目标位置和尺寸，在空闲时合并为一次 geometry 调用
+        self._pending_geom = None
+        self._pending_size = None
+        self._geom_scheduled = False
+        # 本次拖动/缩放手势是否已设置光标（每个手势只设置一次）
+        self._drag_cursor_set = False
+        # 最近一次应用的几何字符串，相同时跳过 geometry 调用
+        self._last_geom = None
+        # 窗口几何缓存，由 _set_geometry 维护
+        self._wc = _WinfoCache()
         
         # 创建窗口
         self._create_window()
@@ -233,57 +463,81 @@ class FloatingWindow:
         self.window.overrideredirect(True)
         
         # 设置透明色键（使背景完全透明）
-        transparent_color = '#000001'
+        transparent_color = COLOR_TRANSPARENT
         self.window.attributes('-transparentcolor', transparent_color)
         self.window.configure(bg=transparent_color)
         
         # 创建主容器框架（透明背景）
-        main_frame = tk.Frame(
+        _ensure_styles(self.parent)
+        self.main_frame = ttk.Frame(self.window, style="Moon.Floating.TFrame")
+        self.main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # 创建字体对象（标签和文本框共用，缩放时只修改字号）
+        self._font = tkfont.Font(
             self.window,
-            bg=transparent_color
+            family=FONT_FAMILY,
+            size=self._base_font_size,
+            weight="bold"
         )
-        main_frame.pack(fill=tk.BOTH, expand=True)
         
-        # 创建可编辑的文本框（初始为只读）
-        self.text_widget = tk.Text(
-            main_frame,
-            font=("Microsoft YaHei UI", self._base_font_size, "bold"),
+        # 创建显示文本的标签（只读显示无需 Text 控件的排版引擎）
+        self.label_widget = tk.Label(
+            self.main_frame,
+            text=self.text,
+            font=self._font,
             bg=transparent_color,
-            fg='#ffffff',
-            insertbackground='#3498db',
-            relief=tk.FLAT,
-            borderwidth=0,
-            wrap=tk.WORD,
+            fg=COLOR_WHITE,
+            justify=tk.LEFT,
+            anchor=tk.NW,
+            wraplength=500 - 2 * 15,
             padx=15,
             pady=10
         )
-        # 先插入文本
-        self.text_widget.insert('1.0', self.text)
-        # 然后设置为只读
-        self.text_widget.config(state='disabled')
-        self.text_widget.pack(fill=tk.BOTH, expand=True)
+        self.label_widget.pack(fill=tk.BOTH, expand=True)
+        self._bind_mouse_events(self.label_widget)
+        
+        # 设置初始窗口大小（更大的默认尺寸）
+        self._set_geometry(500, 200)
+    
+    def _bind_mouse_events(self, widget: tk.Widget) -> None:
+        """为显示/编辑控件绑定鼠标事件
         
-        # 绑定文本区域的鼠标事件
+        Args:
+            widget: 要绑定的控件
+        """
         # 左键：单击移动，连续三击进入编辑模式
-        self.text_widget.bind('<Button-1>', self._on_left_click)
-        self.text_widget.bind('<B1-Motion>', self._on_left_drag)
-        self.text_widget.bind('<ButtonRelease-1>', self._on_left_release)
+        widget.bind('<Button-1>', self._on_left_click)
+        widget.bind('<B1-Motion>', self._on_left_drag)
+        widget.bind('<ButtonRelease-1>', self._on_left_release)
         
         # 右键：单击删除，长按缩放
-        self.text_widget.bind('<Button-3>', self._on_right_click)
-        self.text_widget.bind('<B3-Motion>', self._on_right_drag)
-        self.text_widget.bind('<ButtonRelease-3>', self._on_right_release)
-        
-        # 更新窗口以获取正确的尺寸
-        self.window.update_idletasks()
+        widget.bind('<Button-3>', self._on_right_click)
+        widget.bind('<B3-Motion>', self._on_right_drag)
+        widget.bind('<ButtonRelease-3>', self._on_right_release)
+    
+    def _create_text_widget(self) -> None:
+        """创建编辑用的文本框（首次进入编辑模式时调用）"""
+        self.text_widget = tk.Text(
+            self.main_frame,
+            font=self._font,
+            bg=self.label_widget.cget('bg'),
+            fg=COLOR_WHITE,
+            insertbackground=COLOR_ACCENT,
+            relief=tk.FLAT,
+            borderwidth=0,
+            wrap=tk.WORD,
+            padx=15,
+            pady=10
+        )
+        self._bind_mouse_events(self.text_widget)
         
-        # 设置初始窗口大小（更大的默认尺寸）
-        self.window.geometry("500x200")
+        # Escape键和Enter键退出编辑模式
+        self.text_widget.bind('<Escape>', self._on_edit_key)
+        self.text_widget.bind('<Return>', self._on_edit_key)
     
     def _on_left_click(self, event) -> None:
         """处理左键点击事件 - 检测三连击进入编辑模式"""
-        import time
-        current_time = time.time()
+        current_time = monotonic()
         
         # 检测连续点击（500ms内）
         if current_time - self._last_click_time < 0.5:
@@ -301,35 +555,47 @@ class FloatingWindow:
             # 非编辑模式下，准备移动
             self._drag_start_x = event.x_root
             self._drag_start_y = event.y_root
+            # 每个手势开始时读取一次实际几何，窗口可能已被系统移动
+            self._refresh_geometry()
+            self._pending_geom = (self._wc.x, self._wc.y)
+            self._pending_size = None
     
     def _on_left_drag(self, event) -> None:
         """处理左键拖动事件（移动窗口）"""
-        if not self._is_editing:
-            delta_x = event.x_root - self._drag_start_x
-            delta_y = event.y_root - self._drag_start_y
-            
-            # 只有移动距离超过5像素才认为是拖动
-            if abs(delta_x) > 5 or abs(delta_y) > 5:
-                self._click_count = 0  # 拖动时重置点击计数
-                
-                current_x = self.window.winfo_x()
-                current_y = self.window.winfo_y()
-                
-                new_x = current_x + delta_x
-                new_y = current_y + delta_y
-                
-                self.window.geometry(f"+{new_x}+{new_y}")
-                
-                self._drag_start_x = event.x_root
-                self._drag_start_y = event.y_root
-                
-                self.window.attributes('-topmost', True)
-                self.text_widget.config(cursor='fleur')
+        if self._is_editing:
+            return
+        
+        # 运动事件频繁触发，先将用到的属性读入局部变量
+        x_root = event.x_root
+        y_root = event.y_root
+        delta_x = x_root - self._drag_start_x
+        delta_y = y_root - self._drag_start_y
+        
+        # 只有移动距离超过5像素才认为是拖动
+        if delta_x * delta_x + delta_y * delta_y < DRAG_THRESHOLD_SQ:
+            return
+        
+        self._click_count = 0  # 拖动时重置点击计数
+        
+        # 以尚未应用的目标位置为基准，避免读取到过期的窗口位置
+        pending = self._pending_geom
+        self._pending_geom = (pending[0] + delta_x, pending[1] + delta_y)
+        self._schedule_geometry()
+        
+        self._drag_start_x = x_root
+        self._drag_start_y = y_root
+        
+        if not self._drag_cursor_set:
+            self.label_widget.config(cursor='fleur')
+            self._drag_cursor_set = True
     
     def _on_left_release(self, event) -> None:
         """处理左键释放事件"""
-        if not self._is_editing:
-            self.text_widget.config(cursor='')
+        if not self._is_editing and self._drag_cursor_set:
+            self.label_widget.config(cursor='')
+            self._drag_cursor_set = False
+            # 每次拖动结束时重新确保置顶，而不是在每个移动事件中设置
+            self.window.attributes('-topmost', True)
     
     def _on_right_click(self, event) -> None:
         """处理右键点击事件 - 单击删除"""
@@ -337,141 +603,177 @@ class FloatingWindow:
             # 记录右键按下的位置
             self._resize_start_x = event.x_root
             self._resize_start_y = event.y_root
-            self._resize_start_width = self.window.winfo_width()
-            self._resize_start_height = self.window.winfo_height()
+            # 每个手势开始时读取一次实际几何，窗口可能已被系统移动
+            self._refresh_geometry()
+            wc = self._wc
+            self._resize_start_width = wc.w
+            self._resize_start_height = wc.h
+            self._pending_geom = (wc.x, wc.y)
+            self._pending_size = None
     
     def _on_right_drag(self, event) -> None:
         """处理右键拖动事件（缩放窗口）"""
-        if not self._is_editing:
-            delta_x = event.x_root - self._resize_start_x
-            delta_y = event.y_root - self._resize_start_y
-            
-            # 只有移动距离超过5像素才认为是缩放
-            if abs(delta_x) > 5 or abs(delta_y) > 5:
-                new_width = max(self._resize_start_width + delta_x, 200)
-                new_height = max(self._resize_start_height + delta_y, 100)
-                
-                current_x = self.window.winfo_x()
-                current_y = self.window.winfo_y()
-                self.window.geometry(f"{new_width}x{new_height}+{current_x}+{current_y}")
-                
-                self._update_font_size()
-                self.window.attributes('-topmost', True)
-                self.text_widget.config(cursor='sizing')
+        if self._is_editing:
+            return
+        
+        delta_x = event.x_root - self._resize_start_x
+        delta_y = event.y_root - self._resize_start_y
+        
+        # 只有移动距离超过5像素才认为是缩放
+        if delta_x * delta_x + delta_y * delta_y < DRAG_THRESHOLD_SQ:
+            return
+        
+        new_width = self._resize_start_width + delta_x
+        new_height = self._resize_start_height + delta_y
+        if new_width < 200:
+            new_width = 200
+        if new_height < 100:
+            new_height = 100
+        
+        self._pending_size = (new_width, new_height)
+        self._schedule_geometry()
+        
+        if not self._drag_cursor_set:
+            self.label_widget.config(cursor='sizing')
+            self._drag_cursor_set = True
     
     def _on_right_release(self, event) -> None:
         """处理右键释放事件 - 如果没有拖动则删除"""
-        if not self._is_editing:
-            delta_x = event.x_root - self._resize_start_x
-            delta_y = event.y_root - self._resize_start_y
-            
-            # 如果移动距离小于5像素，认为是单击，执行删除
-            if abs(delta_x) <= 5 and abs(delta_y) <= 5:
-                self._confirm_delete()
-            
-            self.text_widget.config(cursor='')
+        if self._is_editing:
+            return
+        
+        delta_x = event.x_root - self._resize_start_x
+        delta_y = event.y_root - self._resize_start_y
+        
+        # 如果移动距离小于5像素，认为是单击，执行删除
+        if delta_x * delta_x + delta_y * delta_y < DRAG_THRESHOLD_SQ:
+            self._confirm_delete()
+        else:
+            # 每次缩放结束时重新确保置顶，而不是在每个移动事件中设置
+            self.window.attributes('-topmost', True)
+        
+        if self._drag_cursor_set:
+            self.label_widget.config(cursor='')
+            self._drag_cursor_set = False
+    
+    def _schedule_geometry(self) -> None:
+        """安排在空闲时应用待定的窗口位置和尺寸（同一时间只安排一次）"""
+        if not self._geom_scheduled:
+            self._geom_scheduled = True
+            self.window.after_idle(self._flush_geometry)
+    
+    def _flush_geometry(self) -> None:
+        """一次性应用最近一次拖动/缩放事件计算出的窗口几何"""
+        self._geom_scheduled = False
+        if self.window is None or self._pending_geom is None:
+            return
+        
+        x, y = self._pending_geom
+        if self._pending_size is not None:
+            width, height = self._pending_size
+            self._set_geometry(width, height, x, y)
+            self.label_widget.config(wraplength=width - 2 * 15)
+            self._update_font_size(width, height)
+        else:
+            self._set_geometry(x=x, y=y)
+    
+    def _set_geometry(self, width: int = None, height: int = None,
+                      x: int = None, y: int = None) -> None:
+        """设置窗口几何并同步几何缓存，与上次设置相同时跳过
+        
+        Args:
+            width: 窗口宽度（可选，需与 height 同时提供）
+            height: 窗口高度（可选）
+            x: 窗口X坐标（可选，需与 y 同时提供）
+            y: 窗口Y坐标（可选）
+        """
+        geometry = ""
+        if width is not None and height is not None:
+            geometry = f"{width}x{height}"
+            self._wc.w = width
+            self._wc.h = height
+        if x is not None and y is not None:
+            geometry += f"+{x}+{y}"
+            self._wc.x = x
+            self._wc.y = y
+        if geometry == self._last_geom:
+            return
+        self.window.geometry(geometry)
+        self._last_geom = geometry
+    
+    def _refresh_geometry(self) -> None:
+        """从窗口重新读取实际几何（每个拖动/缩放手势开始时调用一次）"""
+        self._wc.refresh(self.window)
+        # 实际几何可能已与上次设置的不同，不能再据此跳过 geometry 调用
+        self._last_geom = None
     
     def _enter_edit_mode(self) -> None:
-        """进入编辑模式"""
-        self._is_editing = True
-        self.text_widget.config(state='normal', cursor='xterm')
+        """进入编辑模式（用文本框替换显示标签）"""
+        if self.text_widget is None:
+            self._create_text_widget()
+        
+        if not self._is_editing:
+            self._is_editing = True
+            self.text_widget.delete('1.0', tk.END)
+            self.text_widget.insert('1.0', self.text)
+            self.label_widget.pack_forget()
+            self.text_widget.pack(fill=tk.BOTH, expand=True)
+        
         self.text_widget.focus_set()
         # 选中所有文本
         self.text_widget.tag_add('sel', '1.0', 'end')
-        
-        # 绑定Escape键和Enter键退出编辑模式
-        self.text_widget.bind('<Escape>', lambda e: self._exit_edit_mode())
-        self.text_widget.bind('<Return>', lambda e: self._exit_edit_mode())
     
     def _exit_edit_mode(self) -> None:
-        """退出编辑模式"""
+        """退出编辑模式（将编辑后的文本写回显示标签）"""
         self._is_editing = False
-        self.text_widget.config(state='disabled', cursor='')
-        self.text_widget.unbind('<Escape>')
-        self.text_widget.unbind('<Return>')
+        self.text = self.text_widget.get('1.0', 'end-1c')
+        self.label_widget.config(text=self.text)
+        self.text_widget.pack_forget()
+        self.label_widget.pack(fill=tk.BOTH, expand=True)
+    
+    def _on_edit_key(self, event):
+        """处理Escape键和Enter键 - 编辑模式下退出编辑"""
+        if self._is_editing:
+            self._exit_edit_mode()
+            # 阻止文本框默认处理（如插入换行）
+            return 'break'
     
     def _confirm_delete(self) -> None:
         """确认删除窗口"""
-        # 创建确认对话框
-        confirm_window = tk.Toplevel(self.window)
-        confirm_window.title("确认删除")
-        confirm_window.geometry("250x100")
-        confirm_window.attributes('-topmost', True)
-        confirm_window.overrideredirect(True)
-        
-        # 居中显示
-        x = self.window.winfo_x() + (self.window.winfo_width() - 250) // 2
-        y = self.window.winfo_y() + (self.window.winfo_height() - 100) // 2
-        confirm_window.geometry(f"250x100+{x}+{y}")
-        
-        # 设置背景
-        confirm_window.configure(bg='#2c3e50')
-        
-        # 提示文字
-        label = tk.Label(
-            confirm_window,
-            text="确定要删除这个窗口吗？",
-            font=("Microsoft YaHei UI", 11),
-            bg='#2c3e50',
-            fg='#ecf0f1'
-        )
-        label.pack(pady=15)
-        
-        # 按钮容器
-        button_frame = tk.Frame(confirm_window, bg='#2c3e50')
-        button_frame.pack(pady=10)
-        
-        # 确认按钮
-        yes_btn = tk.Label(
-            button_frame,
-            text="确定",
-            font=("Microsoft YaHei UI", 10, "bold"),
-            bg='#e74c3c',
-            fg='white',
-            padx=20,
-            pady=5,
-            cursor='hand2'
-        )
-        yes_btn.pack(side=tk.LEFT, padx=10)
-        yes_btn.bind('<Button-1>', lambda e: [confirm_window.destroy(), self.close()])
-        yes_btn.bind('<Enter>', lambda e: yes_btn.config(bg='#c0392b'))
-        yes_btn.bind('<Leave>', lambda e: yes_btn.config(bg='#e74c3c'))
-        
-        # 取消按钮
-        no_btn = tk.Label(
-            button_frame,
-            text="取消",
-            font=("Microsoft YaHei UI", 10, "bold"),
-            bg='#95a5a6',
-            fg='white',
-            padx=20,
-            pady=5,
-            cursor='hand2'
-        )
-        no_btn.pack(side=tk.LEFT, padx=10)
-        no_btn.bind('<Button-1>', lambda e: confirm_window.destroy())
-        no_btn.bind('<Enter>', lambda e: no_btn.config(bg='#7f8c8d'))
-        no_btn.bind('<Leave>', lambda e: no_btn.config(bg='#95a5a6'))
+        # 复用预先创建的确认对话框，只更新目标窗口和位置
+        dialog = _get_confirm_dialog(self.parent)
+        dialog.target = self
+        
+        # 恢复按钮默认配色（隐藏时可能停留在悬停状态）
+        dialog.yes_btn.config(**dialog.yes_btn.base_style)
+        dialog.no_btn.config(**dialog.no_btn.base_style)
+        
+        # 居中显示（右键按下时已刷新几何缓存）
+        wc = self._wc
+        x = wc.x + (wc.w - 250) // 2
+        y = wc.y + (wc.h - 100) // 2
+        dialog.geometry(f"250x100+{x}+{y}")
+        dialog.deiconify()
+        dialog.lift()
     
-    def _update_font_size(self) -> None:
-        """根据窗口大小更新字体大小"""
-        window_width = self.window.winfo_width()
-        window_height = self.window.winfo_height()
+    def _update_font_size(self, window_width: int, window_height: int) -> None:
+        """根据窗口大小更新字体大小
         
-        # 根据窗口面积计算字体大小
+        Args:
+            window_width: 窗口宽度
+            window_height: 窗口高度
+        """
+        # 根据窗口面积查表得到字体大小（已限制在10-32之间）
         area = window_width * window_height
-        base_area = 500 * 200  # 初始窗口面积
+        font_size = FONT_MIN_SIZE + bisect_right(_FONT_AREA_THRESHOLDS, area)
         
-        # 字体大小随面积变化，但有上下限
-        font_size = int(self._base_font_size * (area / base_area) ** 0.3)
-        font_size = max(10, min(font_size, 32))  # 限制在10-32之间
+        # 字体大小未变化时跳过，避免重复的 Tcl 调用和文本重新布局
+        if font_size == self._last_font_size:
+            return
         
-        # 更新字体
-        current_font = self.text_widget.cget("font")
-        if isinstance(current_font, str):
-            self.text_widget.config(font=("Microsoft YaHei UI", font_size, "bold"))
-        else:
-            self.text_widget.config(font=("Microsoft YaHei UI", font_size, "bold"))
+        # 更新共用字体的字号，标签和文本框随之更新
+        self._font.configure(size=font_size)
+        self._last_font_size = font_size
     
 
     
@@ -483,7 +785,7 @@ class FloatingWindow:
             y: 窗口Y坐标（可选）
         """
         if x is not None and y is not None:
-            self.window.geometry(f"+{x}+{y}")
+            self._set_geometry(x=x, y=y)
         
         self.window.deiconify()
     